@@ -2,3 +2,6 @@ MARKET_VALUE_MIN = 1_000_000
 MARKET_VALUE_MAX = 100_000_000
 CONTRACT_MIN_DAYS = 30
 CONTRACT_MAX_DAYS = 365 * 2
+SYNTHETIC_DATA_SEED = 42
+FBREF_CACHE_DIR = "cache"
+FBREF_CACHE_MAX_AGE_HOURS = 24
@@ -1,20 +1,30 @@
 import os
 from collections.abc import Iterator
-from itertools import islice
-from typing import Any
 
 import dlt
 import pandas as pd
 import polars as pl
+import pyarrow as pa  # type: ignore
 import soccerdata as sd  # type: ignore
 
-from src.loader.utils import print_debug_info, transform_player_data
+from src.loader.constants import FBREF_CACHE_DIR
+from src.loader.utils import (
+    is_cache_fresh,
+    print_debug_info,
+    transform_player_data,
+    write_parquet_atomic,
+)
 from src.utils.pandas import flatten_pd_dataframe
 
 
 def fetch_premier_league_data(season: str) -> pl.DataFrame:
     """Fetch Premier League player data from FBref.
 
+    The flattened FBref stats are cached as parquet per season, so repeat runs
+    within FBREF_CACHE_MAX_AGE_HOURS skip the scrape. Set LOADER_DEBUG=1 to print
+    samples of each transformation stage; this only happens on a fresh scrape,
+    since the raw FBref frame is not kept in the cache.
+
     Args:
         season: The season to fetch data for, e.g. "2024" for 2024/25 season
 
@@ -22,15 +32,35 @@ def fetch_premier_league_data(season: str) -> pl.DataFrame:
         Polars DataFrame containing transformed player data
     """
     try:
+        cache_path = os.path.join(FBREF_CACHE_DIR, f"fbref_{season}.parquet")
+        if is_cache_fresh(cache_path=cache_path):
+            # The cache is best-effort: an unreadable file falls back to scraping
+            try:
+                cached_df: pl.DataFrame = pl.read_parquet(cache_path)
+            except Exception as e:
+                print(f"Ignoring unreadable FBref cache {cache_path}: {e}")
+            else:
+                print(f"Loading cached FBref data from {cache_path}")
+                return transform_player_data(df=cached_df)
+
         fbref: sd.FBref = sd.FBref(leagues="ENG-Premier League", seasons=season)
         raw_stats_df = fbref.read_player_season_stats()
 
         flat_df: pd.DataFrame = flatten_pd_dataframe(df=raw_stats_df)
 
-        pl_df: pl.DataFrame = pl.from_pandas(data=flat_df)
+        # Skip the rechunk copy; the transform re-materializes every column anyway
+        pl_df: pl.DataFrame = pl.from_pandas(data=flat_df, rechunk=False)
+
+        # Cache the flattened stats so repeat runs skip the FBref scrape
+        try:
+            write_parquet_atomic(df=pl_df, path=cache_path)
+        except Exception as e:
+            print(f"Could not write FBref cache {cache_path}: {e}")
+
         players_df: pl.DataFrame = transform_player_data(df=pl_df)
 
-        print_debug_info(raw_df=raw_stats_df, flat_df=flat_df, final_df=players_df)
+        if os.environ.get("LOADER_DEBUG") == "1":
+            print_debug_info(raw_df=raw_stats_df, flat_df=flat_df, final_df=players_df)
 
         return players_df
 
@@ -43,7 +73,7 @@ def fetch_premier_league_data(season: str) -> pl.DataFrame:
     write_disposition="replace",
     columns={"contract_end_date": {"data_type": "date"}},
 )
-def generate_player_data(chunk_size: int = 100) -> Iterator[list[dict[str, Any]]]:
+def generate_player_data(chunk_size: int = 100) -> Iterator[pa.RecordBatch]:
     """
     This function generates football transfer listing data in chunks.
     Normally, you could call an API and it would yield data in chunks,
@@ -53,7 +83,7 @@ def generate_player_data(chunk_size: int = 100) -> Iterator[list[dict[str, Any]]
         chunk_size: Number of records per chunk when yielding data
 
     Yields:
-        Chunks of player data dictionaries
+        Chunks of player data as Arrow record batches
     """
     try:
         print("Fetching and transforming player data...")
@@ -61,19 +91,15 @@ def generate_player_data(chunk_size: int = 100) -> Iterator[list[dict[str, Any]]
 
         print(f"Total records to process: {players_df.height}")
 
-        all_records: list[dict[str, Any]] = players_df.to_dicts()
-
-        records_iter: Iterator[dict[str, Any]] = iter(all_records)
+        # Hand dlt Arrow data so it loads it columnar instead of normalizing
+        # one Python dict per row. Convert once; batches are zero-copy views.
+        players_tbl: pa.Table = players_df.to_arrow()
 
         records_processed = 0
-        while True:
-            chunk: list[dict[str, Any]] = list(islice(records_iter, chunk_size))
-            if not chunk:
-                break
-
-            records_processed += len(chunk)
+        for chunk in players_tbl.to_batches(max_chunksize=chunk_size):
+            records_processed += chunk.num_rows
             print(
-                f"Yielding chunk of {len(chunk)} records. Progress: {records_processed}/{players_df.height}"
+                f"Yielding chunk of {chunk.num_rows} records. Progress: {records_processed}/{players_df.height}"
             )
             yield chunk
 
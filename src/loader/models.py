@@ -11,6 +11,12 @@ from src.loader.constants import (
     MARKET_VALUE_MIN,
 )
 
+# Resolve the contract window once at import so validation compares against
+# fixed Date literals
+_TODAY = dt.date.today()
+CONTRACT_END_DATE_MIN = _TODAY + dt.timedelta(days=CONTRACT_MIN_DAYS)
+CONTRACT_END_DATE_MAX = _TODAY + dt.timedelta(days=CONTRACT_MAX_DAYS)
+
 
 class PlayerSchema(pt.Model):
     """Schema definition for transformed player data.
@@ -33,8 +39,8 @@ class PlayerSchema(pt.Model):
     market_value_euro: int = pt.Field(ge=MARKET_VALUE_MIN, le=MARKET_VALUE_MAX)
     contract_end_date: dt.date = pt.Field(
         constraints=pl.col("contract_end_date").is_between(
-            dt.date.today() + dt.timedelta(days=CONTRACT_MIN_DAYS),
-            dt.date.today() + dt.timedelta(days=CONTRACT_MAX_DAYS),
+            pl.lit(CONTRACT_END_DATE_MIN, dtype=pl.Date),
+            pl.lit(CONTRACT_END_DATE_MAX, dtype=pl.Date),
         )
     )
     transfer_status: Literal["available", "unavailable"]
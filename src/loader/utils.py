@@ -1,17 +1,24 @@
 import datetime as dt
-import random
+import os
+import tempfile
 
+import numpy as np
 import pandas as pd
 import polars as pl
 
 from src.loader.constants import (
     CONTRACT_MAX_DAYS,
     CONTRACT_MIN_DAYS,
+    FBREF_CACHE_MAX_AGE_HOURS,
     MARKET_VALUE_MAX,
     MARKET_VALUE_MIN,
+    SYNTHETIC_DATA_SEED,
 )
 from src.loader.models import PlayerSchema
 
+# Shared across calls so synthetic data is reproducible between runs
+_RNG = np.random.default_rng(seed=SYNTHETIC_DATA_SEED)
+
 
 def print_debug_info(
     raw_df: pd.DataFrame, flat_df: pd.DataFrame, final_df: pl.DataFrame
@@ -27,81 +34,118 @@ def print_debug_info(
     print("Index names:", raw_df.index.names)
     print("\nColumn names and types:")
     print(raw_df.dtypes)
-    print("\nSample data (first 2 rows as records):")
-    print(raw_df.head(2).to_dict("records"))
+    print("\nSample data (first 2 rows):")
+    print(raw_df.head(2))
 
     print("\nFlattened DataFrame Info:")
     print("Column names and types:")
     print(flat_df.dtypes)
-    print("\nSample flattened data (first 2 rows as records):")
-    print(flat_df.head(2).to_dict("records"))
+    print("\nSample flattened data (first 2 rows):")
+    print(flat_df.head(2))
 
     print("\nFinal Polars DataFrame Info:")
     print("Schema:")
     print(final_df.schema)
-    print("\nSample transformed data (first 2 rows as dicts):")
-    print(final_df.head(2).to_dicts())
+    print("\nSample transformed data (first 2 rows):")
+    print(final_df.head(2))
+
+
+def is_cache_fresh(
+    cache_path: str, max_age_hours: int = FBREF_CACHE_MAX_AGE_HOURS
+) -> bool:
+    """Check whether a cached file exists and is recent enough to reuse.
+
+    Args:
+        cache_path: Path to the cached file
+        max_age_hours: Maximum age of the file in hours before it is considered stale
+
+    Returns:
+        True if the file exists and was modified within max_age_hours
+    """
+    if not os.path.exists(cache_path):
+        return False
+
+    modified_at = dt.datetime.fromtimestamp(os.path.getmtime(cache_path))
+    return dt.datetime.now() - modified_at < dt.timedelta(hours=max_age_hours)
+
+
+def write_parquet_atomic(df: pl.DataFrame, path: str) -> None:
+    """Write a DataFrame to parquet without ever exposing a partial file.
+
+    The data is written to a temporary file in the target directory and then
+    renamed into place, so an interrupted write cannot leave a truncated file
+    at path.
+
+    Args:
+        df: DataFrame to write
+        path: Final parquet file path
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".parquet.tmp")
+    os.close(fd)
+    try:
+        df.write_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
 def generate_synthetic_columns(
-    df: pl.DataFrame,
+    height: int,
     market_value_min: int = MARKET_VALUE_MIN,
     market_value_max: int = MARKET_VALUE_MAX,
     contract_min_days: int = CONTRACT_MIN_DAYS,
     contract_max_days: int = CONTRACT_MAX_DAYS,
-) -> list[pl.Series]:
+) -> list[pl.Expr]:
     """Generate synthetic columns for player data.
 
     Generates synthetic data including player IDs, market values, contract end dates,
     and transfer status. All generated data follows the PlayerSchema validation rules.
 
     Args:
-        df: Input DataFrame to generate synthetic columns for
+        height: Number of rows to generate synthetic values for
         market_value_min: Minimum market value in euros
         market_value_max: Maximum market value in euros
         contract_min_days: Minimum days until contract end
         contract_max_days: Maximum days until contract end (must be <= 5*365)
 
     Returns:
-        List of Polars Series containing the synthetic columns
+        List of Polars expressions producing the synthetic columns, so they can be
+        added inside a lazy pipeline
     """
-    min_date = dt.datetime.now().date() + dt.timedelta(days=contract_min_days)
-    max_date = dt.datetime.now().date() + dt.timedelta(days=contract_max_days)
+    today = dt.date.today()
+    min_date = today + dt.timedelta(days=contract_min_days)
+    max_date = today + dt.timedelta(days=contract_max_days)
     days_range = (max_date - min_date).days
 
     # Ensure we generate some unavailable players too
-    transfer_statuses = ["available", "unavailable"]
+    transfer_statuses = np.array(["available", "unavailable"])
+
+    # Draw every random value in one vectorized call per column
+    market_values = _RNG.integers(
+        market_value_min, market_value_max + 1, size=height, dtype=np.int64
+    )
+    contract_offsets = _RNG.integers(0, days_range + 1, size=height)
+    contract_end_dates = np.datetime64(min_date, "D") + contract_offsets.astype(
+        "timedelta64[D]"
+    )
+    statuses = _RNG.choice(transfer_statuses, size=height)
 
     return [
-        # Generate sequential IDs
-        pl.int_range(1, df.height + 1, eager=True)
-        .cast(pl.Int64)
-        .map_elements(
-            lambda x: f"PLY{int(x):08d}", return_dtype=pl.Utf8, skip_nulls=False
-        )
-        .alias("id"),
+        # Generate sequential IDs formatted as PLY{8 digits}
+        (
+            pl.lit("PLY") + pl.int_range(1, pl.len() + 1).cast(pl.Utf8).str.zfill(8)
+        ).alias("id"),
         # Generate market values
-        pl.Series(
-            [
-                random.randint(market_value_min, market_value_max)
-                for _ in range(df.height)
-            ]
-        )
-        .cast(pl.Int64)
-        .alias("market_value_euro"),
+        pl.lit(pl.Series(market_values)).cast(pl.Int64).alias("market_value_euro"),
         # Generate contract end dates as Date type
-        pl.Series(
-            [
-                min_date + dt.timedelta(days=random.randint(0, days_range))
-                for _ in range(df.height)
-            ]
-        )
-        .cast(pl.Date)
-        .alias("contract_end_date"),
+        pl.lit(pl.Series(contract_end_dates)).cast(pl.Date).alias("contract_end_date"),
         # Generate random transfer status
-        pl.Series([random.choice(transfer_statuses) for _ in range(df.height)])
-        .cast(pl.Utf8)
-        .alias("transfer_status"),
+        pl.lit(pl.Series(statuses)).cast(pl.Utf8).alias("transfer_status"),
     ]
 
 
@@ -117,30 +161,23 @@ def transform_player_data(df: pl.DataFrame) -> pl.DataFrame:
     Raises:
         patito.ValidationError: If the transformed data doesn't match the schema
     """
-    # Extract age as integer from "age" column which has format "27-137"
-    players_df = df.with_columns(
-        [
-            pl.col("team").alias("current_club"),
-            pl.col("player").alias("player_name"),
-            pl.col("pos").alias("position"),
-            # Extract numeric age from "27-137" format
-            pl.col("age").str.split("-").list.first().cast(pl.Int64).alias("age"),
-        ]
-    )
-
-    # Select and rename relevant columns
-    players_df = players_df.select(
-        [
-            "current_club",
-            "player_name",
-            "position",
-            "age",
-            "nation",
-        ]
+    # Rename, parse and select in one lazy pass so Polars fuses the projections
+    players_df = (
+        df.lazy()
+        .select(
+            [
+                pl.col("team").alias("current_club"),
+                pl.col("player").alias("player_name"),
+                pl.col("pos").alias("position"),
+                # Extract numeric age from "27-137" format
+                pl.col("age").str.extract(r"^(\d+)", 1).cast(pl.Int64).alias("age"),
+                pl.col("nation"),
+            ]
+        )
+        .with_columns(generate_synthetic_columns(df.height))
+        .collect()
     )
 
-    players_df = players_df.with_columns(generate_synthetic_columns(players_df))
-
     validated_df: pl.DataFrame = PlayerSchema.validate(players_df)
 
     return validated_df
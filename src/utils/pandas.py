@@ -14,13 +14,14 @@ def flatten_pd_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Flattened DataFrame with standardized column names
     """
-    # Create a copy to avoid modifying the input
-    flat_df = df.copy()
+    # Reset the hierarchical index to columns; this already returns a new frame,
+    # so the input is left untouched without an extra full copy
+    flat_df = df.reset_index()
 
-    # Flatten multi-index columns using pandas built-in method
-    flat_df.columns = flat_df.columns.to_flat_index().map(
-        lambda x: f"{x[0]}_{x[1]}" if x[1] else x[0]
-    )
+    # Join the two column levels with "_" in vectorized Index ops, dropping empty
+    # second levels
+    top_level = flat_df.columns.get_level_values(0).astype(str)
+    sub_level = flat_df.columns.get_level_values(1).astype(str)
+    flat_df.columns = top_level.where(sub_level == "", top_level + "_" + sub_level)
 
-    # Reset the hierarchical index to columns
-    return flat_df.reset_index() 
\ No newline at end of file
+    return flat_df
@@ -28,7 +28,7 @@ def test_given_sample_df_when_generating_columns_then_returns_correct_column_nam
     df = pl.DataFrame({"dummy": range(3)})  # Simple df with 3 rows
 
     # When
-    expressions = generate_synthetic_columns(df)
+    expressions = generate_synthetic_columns(df.height)
 
     # Then
     assert len(expressions) == 4  # Should have 4 synthetic columns
@@ -57,7 +57,7 @@ def test_given_sample_df_when_applying_expressions_then_generates_valid_syntheti
 
     # When
     expressions = generate_synthetic_columns(
-        df,
+        df.height,
         market_value_min=market_min,
         market_value_max=market_max,
         contract_min_days=min_days,
@@ -97,7 +97,7 @@ def test_given_empty_df_when_generating_columns_then_handles_gracefully() -> Non
     df = pl.DataFrame({"dummy": []})
 
     # When
-    expressions = generate_synthetic_columns(df)
+    expressions = generate_synthetic_columns(df.height)
     result = df.with_columns(expressions)
 
     # Then
@@ -0,0 +1,54 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.loader.utils import is_cache_fresh
+
+
+def test_given_missing_file_when_checking_cache_then_returns_false(
+    tmp_path: Path,
+) -> None:
+    # Given
+    cache_path = tmp_path / "fbref_2024.parquet"
+
+    # When
+    result = is_cache_fresh(cache_path=str(cache_path))
+
+    # Then
+    assert result is False
+
+
+def test_given_recent_file_when_checking_cache_then_returns_true(
+    tmp_path: Path,
+) -> None:
+    # Given
+    cache_path = tmp_path / "fbref_2024.parquet"
+    cache_path.write_bytes(b"")
+
+    # When
+    result = is_cache_fresh(cache_path=str(cache_path), max_age_hours=1)
+
+    # Then
+    assert result is True
+
+
+def test_given_stale_file_when_checking_cache_then_returns_false(
+    tmp_path: Path,
+) -> None:
+    # Given
+    cache_path = tmp_path / "fbref_2024.parquet"
+    cache_path.write_bytes(b"")
+    two_hours_ago = time.time() - 2 * 60 * 60
+    os.utime(cache_path, (two_hours_ago, two_hours_ago))
+
+    # When
+    result = is_cache_fresh(cache_path=str(cache_path), max_age_hours=1)
+
+    # Then
+    assert result is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from src.loader.utils import write_parquet_atomic
+
+
+def test_given_dataframe_when_writing_then_file_round_trips_without_temp_files(
+    tmp_path: Path,
+) -> None:
+    # Given
+    df = pl.DataFrame({"player": ["Ben White", "Bukayo Saka"], "age": [27, 23]})
+    cache_path = tmp_path / "cache" / "fbref_2024.parquet"
+
+    # When
+    write_parquet_atomic(df=df, path=str(cache_path))
+
+    # Then
+    assert pl.read_parquet(cache_path).equals(df)
+    assert [p.name for p in cache_path.parent.iterdir()] == ["fbref_2024.parquet"]
+
+
+def test_given_failing_write_when_writing_then_existing_file_is_untouched(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given
+    original_df = pl.DataFrame({"age": [27]})
+    cache_path = tmp_path / "fbref_2024.parquet"
+    original_df.write_parquet(cache_path)
+
+    def failing_write(self: pl.DataFrame, *args: object, **kwargs: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pl.DataFrame, "write_parquet", failing_write)
+
+    # When
+    with pytest.raises(OSError):
+        write_parquet_atomic(df=pl.DataFrame({"age": [30]}), path=str(cache_path))
+
+    # Then
+    monkeypatch.undo()
+    assert pl.read_parquet(cache_path).equals(original_df)
+    assert [p.name for p in tmp_path.iterdir()] == ["fbref_2024.parquet"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])